@@ -895,6 +895,13 @@ func parseMifareKey(keyHex string) ([]byte, error) {
 	return key, nil
 }
 
+// parseVerifyFlag reports whether a write request asked for the data to be read
+// back from the card (?verify=1 or ?verify=true).
+func parseVerifyFlag(r *http.Request) bool {
+	v := r.URL.Query().Get("verify")
+	return v == "1" || v == "true"
+}
+
 // parseMifareKeyType converts a key type string ("A" or "B") to a byte.
 // Returns 'A' by default.
 func parseMifareKeyType(kt string) byte {
@@ -908,6 +915,8 @@ func parseMifareKeyType(kt string) byte {
 // GET /v1/readers/{n}/mifare/{block} - Read block
 // POST /v1/readers/{n}/mifare/{block} - Write block
 // POST /v1/readers/{n}/mifare/batch - Write multiple blocks in a single session
+// POST /v1/readers/{n}/mifare/batch-read - Read multiple blocks in a single session
+// POST /v1/readers/{n}/mifare/test-cycle - Write, verify and clean up blocks in a single session
 // POST /v1/readers/{n}/mifare/derive-key - Derive key from UID via AES
 // POST /v1/readers/{n}/mifare/aes-write/{block} - AES encrypt and write block
 // POST /v1/readers/{n}/mifare/sector-trailer/{block} - Write sector trailer with keys and access bits
@@ -915,7 +924,7 @@ func handleMifareBlock(w http.ResponseWriter, r *http.Request, readerName string
 	// Expect path: /v1/readers/{n}/mifare/{block or operation}
 	if len(parts) < 5 {
 		respondJSON(w, http.StatusBadRequest, map[string]string{
-			"error": "missing block number or operation (use /mifare/{block}, /mifare/batch, /mifare/derive-key, /mifare/aes-write/{block}, or /mifare/sector-trailer/{block})",
+			"error": "missing block number or operation (use /mifare/{block}, /mifare/batch, /mifare/batch-read, /mifare/test-cycle, /mifare/derive-key, /mifare/aes-write/{block}, or /mifare/sector-trailer/{block})",
 		})
 		return
 	}
@@ -925,6 +934,12 @@ func handleMifareBlock(w http.ResponseWriter, r *http.Request, readerName string
 	case "batch":
 		handleMifareBatch(w, r, readerName)
 		return
+	case "batch-read":
+		handleMifareBatchRead(w, r, readerName)
+		return
+	case "test-cycle":
+		handleMifareTestCycle(w, r, readerName)
+		return
 	case "derive-key":
 		handleMifareDeriveKey(w, r, readerName)
 		return
@@ -1021,8 +1036,25 @@ func handleMifareBlock(w http.ResponseWriter, r *http.Request, readerName string
 			return
 		}
 
-		respondJSON(w, http.StatusOK, map[string]bool{
-			"success": true,
+		if !parseVerifyFlag(r) {
+			respondJSON(w, http.StatusOK, map[string]bool{
+				"success": true,
+			})
+			return
+		}
+
+		// Read the block back so the client can skip its own GET
+		readBack, err := core.ReadMifareBlock(readerName, blockNum, key, keyType)
+		if err != nil {
+			respondJSON(w, http.StatusOK, map[string]interface{}{
+				"success": true,
+				"error":   fmt.Sprintf("read-back failed: %v", err),
+			})
+			return
+		}
+		respondJSON(w, http.StatusOK, map[string]interface{}{
+			"success":  true,
+			"readBack": hex.EncodeToString(readBack),
 		})
 
 	default:
@@ -1034,19 +1066,28 @@ func handleMifareBlock(w http.ResponseWriter, r *http.Request, readerName string
 // GET /v1/readers/{n}/ultralight/{page} - Read page
 // POST /v1/readers/{n}/ultralight/{page} - Write page
 // POST /v1/readers/{n}/ultralight/batch - Write multiple pages
+// POST /v1/readers/{n}/ultralight/batch-read - Read multiple pages
+// POST /v1/readers/{n}/ultralight/test-cycle - Write, verify and clean up pages
 func handleUltralightPage(w http.ResponseWriter, r *http.Request, readerName string, parts []string) {
 	// Expect path: /v1/readers/{n}/ultralight/{page} or /v1/readers/{n}/ultralight/batch
 	if len(parts) < 5 {
 		respondJSON(w, http.StatusBadRequest, map[string]string{
-			"error": "missing page number (use /ultralight/{page} or /ultralight/batch)",
+			"error": "missing page number (use /ultralight/{page}, /ultralight/batch, /ultralight/batch-read, or /ultralight/test-cycle)",
 		})
 		return
 	}
 
-	// Handle batch write
-	if parts[4] == "batch" {
+	// Handle batch operations
+	switch parts[4] {
+	case "batch":
 		handleUltralightBatch(w, r, readerName)
 		return
+	case "batch-read":
+		handleUltralightBatchRead(w, r, readerName)
+		return
+	case "test-cycle":
+		handleUltralightTestCycle(w, r, readerName)
+		return
 	}
 
 	pageNum, err := strconv.Atoi(parts[4])
@@ -1118,7 +1159,24 @@ func handleUltralightPage(w http.ResponseWriter, r *http.Request, readerName str
 			return
 		}
 
-		respondJSON(w, http.StatusOK, map[string]bool{"success": true})
+		if !parseVerifyFlag(r) {
+			respondJSON(w, http.StatusOK, map[string]bool{"success": true})
+			return
+		}
+
+		// Read the page back so the client can skip its own GET
+		readBack, err := core.ReadUltralightPage(readerName, pageNum, password)
+		if err != nil {
+			respondJSON(w, http.StatusOK, map[string]interface{}{
+				"success": true,
+				"error":   fmt.Sprintf("read-back failed: %v", err),
+			})
+			return
+		}
+		respondJSON(w, http.StatusOK, map[string]interface{}{
+			"success":  true,
+			"readBack": hex.EncodeToString(readBack),
+		})
 
 	default:
 		http.Error(w, http.StatusText(http.StatusMethodNotAllowed), http.StatusMethodNotAllowed)
@@ -1185,7 +1243,7 @@ func handleUltralightBatch(w http.ResponseWriter, r *http.Request, readerName st
 		return
 	}
 
-	results, err := core.WriteUltralightPages(readerName, pages, password)
+	results, err := core.WriteUltralightPages(readerName, pages, password, parseVerifyFlag(r))
 	if err != nil {
 		logging.Debug(logging.CatHTTP, "Ultralight batch write failed", map[string]any{
 			"reader": readerName,
@@ -1210,6 +1268,142 @@ func handleUltralightBatch(w http.ResponseWriter, r *http.Request, readerName st
 	})
 }
 
+// handleUltralightBatchRead handles batch read operations on MIFARE Ultralight pages
+// POST /v1/readers/{n}/ultralight/batch-read - Read multiple pages in a single card session
+func handleUltralightBatchRead(w http.ResponseWriter, r *http.Request, readerName string) {
+	if r.Method != http.MethodPost {
+		http.Error(w, http.StatusText(http.StatusMethodNotAllowed), http.StatusMethodNotAllowed)
+		return
+	}
+
+	var req struct {
+		Pages    []int  `json:"pages"`
+		Password string `json:"password"` // Optional, hex string, 8 chars = 4 bytes
+	}
+
+	if err := json.NewDecoder(r.Body).Decode(&req); err != nil {
+		respondJSON(w, http.StatusBadRequest, map[string]string{"error": "invalid request body"})
+		return
+	}
+
+	if len(req.Pages) == 0 {
+		respondJSON(w, http.StatusBadRequest, map[string]string{"error": "no pages provided"})
+		return
+	}
+
+	password, err := parseUltralightPassword(req.Password)
+	if err != nil {
+		respondJSON(w, http.StatusBadRequest, map[string]string{"error": err.Error()})
+		return
+	}
+
+	results, err := core.ReadUltralightPages(readerName, req.Pages, password)
+	if err != nil {
+		logging.Debug(logging.CatHTTP, "Ultralight batch read failed", map[string]any{
+			"reader": readerName,
+			"error":  err.Error(),
+		})
+		respondJSON(w, http.StatusInternalServerError, map[string]string{"error": err.Error()})
+		return
+	}
+
+	// Count successes
+	successCount := 0
+	for _, result := range results {
+		if result.Success {
+			successCount++
+		}
+	}
+
+	respondJSON(w, http.StatusOK, map[string]interface{}{
+		"results": results,
+		"read":    successCount,
+		"total":   len(results),
+	})
+}
+
+// handleUltralightTestCycle writes, reads back and cleans up MIFARE Ultralight pages
+// POST /v1/readers/{n}/ultralight/test-cycle - Write/verify/cleanup in a single card session
+func handleUltralightTestCycle(w http.ResponseWriter, r *http.Request, readerName string) {
+	if r.Method != http.MethodPost {
+		http.Error(w, http.StatusText(http.StatusMethodNotAllowed), http.StatusMethodNotAllowed)
+		return
+	}
+
+	var req struct {
+		Ops []struct {
+			Page    int    `json:"page"`
+			Write   string `json:"write"`   // Hex string, 8 chars = 4 bytes
+			Cleanup string `json:"cleanup"` // Optional, hex string, 8 chars = 4 bytes
+		} `json:"ops"`
+		Password string `json:"password"` // Optional, hex string, 8 chars = 4 bytes
+	}
+
+	if err := json.NewDecoder(r.Body).Decode(&req); err != nil {
+		respondJSON(w, http.StatusBadRequest, map[string]string{"error": "invalid request body"})
+		return
+	}
+
+	if len(req.Ops) == 0 {
+		respondJSON(w, http.StatusBadRequest, map[string]string{"error": "no pages provided"})
+		return
+	}
+
+	// Convert to core types
+	ops := make([]core.UltralightTestCycleOp, len(req.Ops))
+	for i, op := range req.Ops {
+		write, err := hex.DecodeString(op.Write)
+		if err != nil || len(write) != 4 {
+			respondJSON(w, http.StatusBadRequest, map[string]string{
+				"error": fmt.Sprintf("page %d: invalid data (must be 8 hex characters for 4 bytes)", op.Page),
+			})
+			return
+		}
+		cleanup, err := hex.DecodeString(op.Cleanup)
+		if err != nil || (len(cleanup) != 0 && len(cleanup) != 4) {
+			respondJSON(w, http.StatusBadRequest, map[string]string{
+				"error": fmt.Sprintf("page %d: invalid cleanup data (must be 8 hex characters for 4 bytes)", op.Page),
+			})
+			return
+		}
+		ops[i] = core.UltralightTestCycleOp{
+			Page:    op.Page,
+			Write:   write,
+			Cleanup: cleanup,
+		}
+	}
+
+	password, err := parseUltralightPassword(req.Password)
+	if err != nil {
+		respondJSON(w, http.StatusBadRequest, map[string]string{"error": err.Error()})
+		return
+	}
+
+	results, err := core.RunUltralightTestCycle(readerName, ops, password)
+	if err != nil {
+		logging.Debug(logging.CatHTTP, "Ultralight test cycle failed", map[string]any{
+			"reader": readerName,
+			"error":  err.Error(),
+		})
+		respondJSON(w, http.StatusInternalServerError, map[string]string{"error": err.Error()})
+		return
+	}
+
+	// Count verified pages
+	matchCount := 0
+	for _, result := range results {
+		if result.Matches {
+			matchCount++
+		}
+	}
+
+	respondJSON(w, http.StatusOK, map[string]interface{}{
+		"results": results,
+		"matched": matchCount,
+		"total":   len(results),
+	})
+}
+
 // handleMifareBatch handles batch write operations on MIFARE Classic blocks
 // POST /v1/readers/{n}/mifare/batch - Write multiple blocks in a single card session
 func handleMifareBatch(w http.ResponseWriter, r *http.Request, readerName string) {
@@ -1260,7 +1454,7 @@ func handleMifareBatch(w http.ResponseWriter, r *http.Request, readerName string
 	}
 	keyType := parseMifareKeyType(req.KeyType)
 
-	results, err := core.WriteMifareBlocks(readerName, blocks, key, keyType)
+	results, err := core.WriteMifareBlocks(readerName, blocks, key, keyType, parseVerifyFlag(r))
 	if err != nil {
 		logging.Debug(logging.CatHTTP, "MIFARE batch write failed", map[string]any{
 			"reader": readerName,
@@ -1285,6 +1479,146 @@ func handleMifareBatch(w http.ResponseWriter, r *http.Request, readerName string
 	})
 }
 
+// handleMifareBatchRead handles batch read operations on MIFARE Classic blocks
+// POST /v1/readers/{n}/mifare/batch-read - Read multiple blocks in a single card session
+func handleMifareBatchRead(w http.ResponseWriter, r *http.Request, readerName string) {
+	if r.Method != http.MethodPost {
+		http.Error(w, http.StatusText(http.StatusMethodNotAllowed), http.StatusMethodNotAllowed)
+		return
+	}
+
+	var req struct {
+		Blocks  []int  `json:"blocks"`
+		Key     string `json:"key"`     // Hex string, 12 chars = 6 bytes
+		KeyType string `json:"keyType"` // "A" or "B"
+	}
+
+	if err := json.NewDecoder(r.Body).Decode(&req); err != nil {
+		respondJSON(w, http.StatusBadRequest, map[string]string{"error": "invalid request body"})
+		return
+	}
+
+	if len(req.Blocks) == 0 {
+		respondJSON(w, http.StatusBadRequest, map[string]string{"error": "no blocks provided"})
+		return
+	}
+
+	key, err := parseMifareKey(req.Key)
+	if err != nil {
+		respondJSON(w, http.StatusBadRequest, map[string]string{"error": err.Error()})
+		return
+	}
+	keyType := parseMifareKeyType(req.KeyType)
+
+	results, err := core.ReadMifareBlocks(readerName, req.Blocks, key, keyType)
+	if err != nil {
+		logging.Debug(logging.CatHTTP, "MIFARE batch read failed", map[string]any{
+			"reader": readerName,
+			"error":  err.Error(),
+		})
+		respondJSON(w, http.StatusInternalServerError, map[string]string{"error": err.Error()})
+		return
+	}
+
+	// Count successes
+	successCount := 0
+	for _, result := range results {
+		if result.Success {
+			successCount++
+		}
+	}
+
+	respondJSON(w, http.StatusOK, map[string]interface{}{
+		"results": results,
+		"read":    successCount,
+		"total":   len(results),
+	})
+}
+
+// handleMifareTestCycle writes, reads back and cleans up MIFARE Classic blocks
+// POST /v1/readers/{n}/mifare/test-cycle - Write/verify/cleanup in a single card session
+func handleMifareTestCycle(w http.ResponseWriter, r *http.Request, readerName string) {
+	if r.Method != http.MethodPost {
+		http.Error(w, http.StatusText(http.StatusMethodNotAllowed), http.StatusMethodNotAllowed)
+		return
+	}
+
+	var req struct {
+		Ops []struct {
+			Block   int    `json:"block"`
+			Write   string `json:"write"`   // Hex string, 32 chars = 16 bytes
+			Cleanup string `json:"cleanup"` // Optional, hex string, 32 chars = 16 bytes
+		} `json:"ops"`
+		Key     string `json:"key"`     // Hex string, 12 chars = 6 bytes
+		KeyType string `json:"keyType"` // "A" or "B"
+	}
+
+	if err := json.NewDecoder(r.Body).Decode(&req); err != nil {
+		respondJSON(w, http.StatusBadRequest, map[string]string{"error": "invalid request body"})
+		return
+	}
+
+	if len(req.Ops) == 0 {
+		respondJSON(w, http.StatusBadRequest, map[string]string{"error": "no blocks provided"})
+		return
+	}
+
+	// Convert to core types
+	ops := make([]core.MifareTestCycleOp, len(req.Ops))
+	for i, op := range req.Ops {
+		write, err := hex.DecodeString(op.Write)
+		if err != nil || len(write) != 16 {
+			respondJSON(w, http.StatusBadRequest, map[string]string{
+				"error": fmt.Sprintf("block %d: invalid data (must be 32 hex characters for 16 bytes)", op.Block),
+			})
+			return
+		}
+		cleanup, err := hex.DecodeString(op.Cleanup)
+		if err != nil || (len(cleanup) != 0 && len(cleanup) != 16) {
+			respondJSON(w, http.StatusBadRequest, map[string]string{
+				"error": fmt.Sprintf("block %d: invalid cleanup data (must be 32 hex characters for 16 bytes)", op.Block),
+			})
+			return
+		}
+		ops[i] = core.MifareTestCycleOp{
+			Block:   op.Block,
+			Write:   write,
+			Cleanup: cleanup,
+		}
+	}
+
+	key, err := parseMifareKey(req.Key)
+	if err != nil {
+		respondJSON(w, http.StatusBadRequest, map[string]string{"error": err.Error()})
+		return
+	}
+	keyType := parseMifareKeyType(req.KeyType)
+
+	results, err := core.RunMifareTestCycle(readerName, ops, key, keyType)
+	if err != nil {
+		logging.Debug(logging.CatHTTP, "MIFARE test cycle failed", map[string]any{
+			"reader": readerName,
+			"error":  err.Error(),
+		})
+		respondJSON(w, http.StatusInternalServerError, map[string]string{"error": err.Error()})
+		return
+	}
+
+	// Count verified blocks
+	matchCount := 0
+	for _, result := range results {
+		if result.Matches {
+			matchCount++
+		}
+	}
+
+	respondJSON(w, http.StatusOK, map[string]interface{}{
+		"results": results,
+		"matched": matchCount,
+		"total":   len(results),
+	})
+}
+
 // handleMifareDeriveKey derives a 6-byte MIFARE key from the card's UID using AES-128-ECB
 // POST /v1/readers/{n}/mifare/derive-key
 func handleMifareDeriveKey(w http.ResponseWriter, r *http.Request, readerName string) {
@@ -372,6 +372,72 @@ func TestHandleReaderRoutes_UnknownEndpoint(t *testing.T) {
 	}
 }
 
+func TestHandleBatchOps_Validation(t *testing.T) {
+	// These cases are rejected before any card access, so no reader is needed
+	tests := []struct {
+		name         string
+		handler      func(http.ResponseWriter, *http.Request, string)
+		method       string
+		body         string
+		expectedCode int
+	}{
+		{"mifare GET not allowed", handleMifareBatchRead, http.MethodGet, "", http.StatusMethodNotAllowed},
+		{"mifare invalid JSON", handleMifareBatchRead, http.MethodPost, "{invalid json}", http.StatusBadRequest},
+		{"mifare no blocks", handleMifareBatchRead, http.MethodPost, `{"blocks":[]}`, http.StatusBadRequest},
+		{"mifare bad key", handleMifareBatchRead, http.MethodPost, `{"blocks":[4],"key":"FFFF"}`, http.StatusBadRequest},
+		{"ultralight GET not allowed", handleUltralightBatchRead, http.MethodGet, "", http.StatusMethodNotAllowed},
+		{"ultralight invalid JSON", handleUltralightBatchRead, http.MethodPost, "{invalid json}", http.StatusBadRequest},
+		{"ultralight no pages", handleUltralightBatchRead, http.MethodPost, `{"pages":[]}`, http.StatusBadRequest},
+		{"ultralight bad password", handleUltralightBatchRead, http.MethodPost, `{"pages":[4],"password":"FF"}`, http.StatusBadRequest},
+		{"mifare cycle GET not allowed", handleMifareTestCycle, http.MethodGet, "", http.StatusMethodNotAllowed},
+		{"mifare cycle no ops", handleMifareTestCycle, http.MethodPost, `{"ops":[]}`, http.StatusBadRequest},
+		{"mifare cycle bad cleanup", handleMifareTestCycle, http.MethodPost, `{"ops":[{"block":4,"write":"00112233445566778899AABBCCDDEEFF","cleanup":"00"}]}`, http.StatusBadRequest},
+		{"ultralight cycle GET not allowed", handleUltralightTestCycle, http.MethodGet, "", http.StatusMethodNotAllowed},
+		{"ultralight cycle no ops", handleUltralightTestCycle, http.MethodPost, `{"ops":[]}`, http.StatusBadRequest},
+		{"ultralight cycle bad write", handleUltralightTestCycle, http.MethodPost, `{"ops":[{"page":10,"write":"DEAD"}]}`, http.StatusBadRequest},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			req := httptest.NewRequest(tt.method, "/test", bytes.NewBufferString(tt.body))
+			w := httptest.NewRecorder()
+
+			tt.handler(w, req, "fake-reader")
+
+			if w.Code != tt.expectedCode {
+				t.Errorf("expected status %d, got %d", tt.expectedCode, w.Code)
+			}
+		})
+	}
+}
+
+func TestParseVerifyFlag(t *testing.T) {
+	tests := []struct {
+		name     string
+		query    string
+		expected bool
+	}{
+		{"omitted", "", false},
+		{"one", "?verify=1", true},
+		{"true", "?verify=true", true},
+		{"zero", "?verify=0", false},
+		{"false", "?verify=false", false},
+		{"empty value", "?verify=", false},
+		{"other value", "?verify=yes", false},
+		{"other parameter", "?key=FFFFFFFFFFFF", false},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			req := httptest.NewRequest(http.MethodPost, "/v1/readers/0/mifare/batch"+tt.query, nil)
+
+			if got := parseVerifyFlag(req); got != tt.expected {
+				t.Errorf("parseVerifyFlag(%q) = %v, want %v", tt.query, got, tt.expected)
+			}
+		})
+	}
+}
+
 func TestVersionVariables(t *testing.T) {
 	// Test that version variables are initialized
 	if Version == "" {
@@ -801,6 +801,7 @@ func (c *WSClient) handleWriteMifareBlocks(id string, payload json.RawMessage) {
 		} `json:"blocks"`
 		Key     string `json:"key"`     // Hex string, 12 chars = 6 bytes
 		KeyType string `json:"keyType"` // "A" or "B"
+		Verify  bool   `json:"verify"`  // Optional, read each block back after writing
 	}
 	if err := json.Unmarshal(payload, &req); err != nil {
 		c.sendError(id, "invalid payload")
@@ -839,7 +840,7 @@ func (c *WSClient) handleWriteMifareBlocks(id string, payload json.RawMessage) {
 	}
 	keyType := parseMifareKeyType(req.KeyType)
 
-	results, err := core.WriteMifareBlocks(readers[req.ReaderIndex].Name, blocks, key, keyType)
+	results, err := core.WriteMifareBlocks(readers[req.ReaderIndex].Name, blocks, key, keyType, req.Verify)
 	if err != nil {
 		c.sendError(id, err.Error())
 		return
@@ -944,6 +945,7 @@ func (c *WSClient) handleWriteUltralightPages(id string, payload json.RawMessage
 			Data string `json:"data"` // Hex string, 8 chars = 4 bytes
 		} `json:"pages"`
 		Password string `json:"password"` // Optional, hex string, 8 chars = 4 bytes
+		Verify   bool   `json:"verify"`   // Optional, read each page back after writing
 	}
 	if err := json.Unmarshal(payload, &req); err != nil {
 		c.sendError(id, "invalid payload")
@@ -981,7 +983,7 @@ func (c *WSClient) handleWriteUltralightPages(id string, payload json.RawMessage
 		return
 	}
 
-	results, err := core.WriteUltralightPages(readers[req.ReaderIndex].Name, pages, password)
+	results, err := core.WriteUltralightPages(readers[req.ReaderIndex].Name, pages, password, req.Verify)
 	if err != nil {
 		c.sendError(id, err.Error())
 		return
@@ -208,6 +208,31 @@ func TestWSClient_sendResponse(t *testing.T) {
 	}
 }
 
+func TestWSClient_sendResponse_NestedPayload(t *testing.T) {
+	client := &WSClient{
+		send: make(chan []byte, 256),
+	}
+
+	client.sendResponse("", "card_detected", map[string]interface{}{
+		"readerIndex": 0,
+		"card":        map[string]string{"uid": "04AABBCC"},
+	})
+
+	select {
+	case msg := <-client.send:
+		// Clients decode the frame once; payload must be an object, not a JSON string
+		var raw map[string]json.RawMessage
+		if err := json.Unmarshal(msg, &raw); err != nil {
+			t.Fatalf("failed to unmarshal response: %v", err)
+		}
+		if len(raw["payload"]) == 0 || raw["payload"][0] != '{' {
+			t.Errorf("expected payload to be a JSON object, got %s", raw["payload"])
+		}
+	case <-time.After(time.Second):
+		t.Error("timeout waiting for response")
+	}
+}
+
 func TestWSClient_sendError(t *testing.T) {
 	client := &WSClient{
 		send: make(chan []byte, 256),
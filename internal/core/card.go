@@ -1,6 +1,7 @@
 package core
 
 import (
+	"bytes"
 	"crypto/aes"
 	"encoding/base64"
 	"encoding/hex"
@@ -1925,6 +1926,21 @@ func ReadMifareBlock(readerName string, block int, key []byte, keyType byte) ([]
 		return nil, err
 	}
 
+	data, err := transmitMifareRead(card, block)
+	if err != nil {
+		return nil, err
+	}
+
+	logging.Info(logging.CatCard, "MIFARE block read", map[string]any{
+		"block": block,
+		"data":  hex.EncodeToString(data),
+	})
+
+	return data, nil
+}
+
+// transmitMifareRead reads a 16-byte block from a sector that is already authenticated.
+func transmitMifareRead(card *scard.Card, block int) ([]byte, error) {
 	// Read block: FF B0 00 [block] 10
 	readCmd := []byte{0xFF, 0xB0, 0x00, byte(block), 0x10}
 	rsp, err := card.Transmit(readCmd)
@@ -1932,14 +1948,11 @@ func ReadMifareBlock(readerName string, block int, key []byte, keyType byte) ([]
 		return nil, fmt.Errorf("failed to read block %d: %w", block, err)
 	}
 	if len(rsp) < 18 || rsp[len(rsp)-2] != 0x90 {
+		if len(rsp) < 2 {
+			return nil, fmt.Errorf("read failed for block %d: short response", block)
+		}
 		return nil, fmt.Errorf("read failed for block %d: status %02X %02X", block, rsp[len(rsp)-2], rsp[len(rsp)-1])
 	}
-
-	logging.Info(logging.CatCard, "MIFARE block read", map[string]any{
-		"block": block,
-		"data":  hex.EncodeToString(rsp[:16]),
-	})
-
 	return rsp[:16], nil
 }
 
@@ -2027,6 +2040,12 @@ func ReadUltralightPage(readerName string, page int, password []byte) ([]byte, e
 		}
 	}
 
+	return readUltralightPageOnCard(card, page)
+}
+
+// readUltralightPageOnCard reads a 4-byte page on an already-connected card,
+// trying each reader-specific read method in turn.
+func readUltralightPageOnCard(card *scard.Card, page int) ([]byte, error) {
 	// Method 1: Standard READ BINARY command (works on most readers including ACR1252U)
 	// APDU: FF B0 00 [page] 10 (reads 16 bytes = 4 pages)
 	readCmd := []byte{0xFF, 0xB0, 0x00, byte(page), 0x10}
@@ -2259,15 +2278,17 @@ type UltralightPageWrite struct {
 
 // UltralightWriteResult represents the result of a single page write.
 type UltralightWriteResult struct {
-	Page    int    `json:"page"`
-	Success bool   `json:"success"`
-	Error   string `json:"error,omitempty"`
+	Page     int    `json:"page"`
+	Success  bool   `json:"success"`
+	ReadBack string `json:"readBack,omitempty"` // Hex string, set when verify is requested
+	Error    string `json:"error,omitempty"`
 }
 
 // WriteUltralightPages writes multiple pages to a MIFARE Ultralight / NTAG card
 // in a single card session. This is more efficient and reliable than multiple
-// individual WriteUltralightPage calls.
-func WriteUltralightPages(readerName string, pages []UltralightPageWrite, password []byte) ([]UltralightWriteResult, error) {
+// individual WriteUltralightPage calls. If verify is set, each page is read
+// back after writing and returned in ReadBack.
+func WriteUltralightPages(readerName string, pages []UltralightPageWrite, password []byte, verify bool) ([]UltralightWriteResult, error) {
 	if len(pages) == 0 {
 		return nil, fmt.Errorf("no pages to write")
 	}
@@ -2309,85 +2330,245 @@ func WriteUltralightPages(readerName string, pages []UltralightPageWrite, passwo
 	for i, p := range pages {
 		results[i].Page = p.Page
 
-		// Try Method 1: Standard UPDATE BINARY (works on most readers)
-		writeCmd := []byte{0xFF, 0xD6, 0x00, byte(p.Page), 0x04}
-		writeCmd = append(writeCmd, p.Data...)
-		rsp, err := card.Transmit(writeCmd)
-
-		if err == nil && len(rsp) >= 2 && rsp[len(rsp)-2] == 0x90 && rsp[len(rsp)-1] == 0x00 {
-			results[i].Success = true
-			logging.Info(logging.CatCard, "Ultralight page written (batch)", map[string]any{
-				"page": p.Page,
-				"data": hex.EncodeToString(p.Data),
-			})
+		method, err := writeUltralightPageOnCard(card, p.Page, p.Data)
+		if err != nil {
+			results[i].Error = err.Error()
 			continue
 		}
 
-		// Try Method 2: ACR122U InCommunicateThru
-		directCmd := []byte{0xFF, 0x00, 0x00, 0x00, 0x08, 0xD4, 0x42, 0xA2, byte(p.Page)}
-		directCmd = append(directCmd, p.Data...)
-		rsp, err = card.Transmit(directCmd)
+		results[i].Success = true
+		logging.Info(logging.CatCard, "Ultralight page written (batch)", map[string]any{
+			"page":   p.Page,
+			"data":   hex.EncodeToString(p.Data),
+			"method": method,
+		})
 
-		if err == nil && len(rsp) >= 2 {
-			sw1, sw2 := rsp[len(rsp)-2], rsp[len(rsp)-1]
-			if sw1 == 0x90 && sw2 == 0x00 {
-				if len(rsp) >= 3 && rsp[0] == 0xD5 && rsp[1] == 0x43 && rsp[2] != 0x00 {
-					results[i].Error = fmt.Sprintf("card error %02X", rsp[2])
-					continue
-				}
-				results[i].Success = true
-				logging.Info(logging.CatCard, "Ultralight page written (batch)", map[string]any{
-					"page": p.Page,
-					"data": hex.EncodeToString(p.Data),
-				})
+		if verify {
+			data, err := readUltralightPageOnCard(card, p.Page)
+			if err != nil {
+				results[i].Error = fmt.Sprintf("read-back failed: %v", err)
 				continue
 			}
+			results[i].ReadBack = hex.EncodeToString(data)
 		}
+	}
 
-		// Try Method 3: ACR1552 Transparent Exchange with native WRITE command (0xA2)
-		startSession := []byte{0xFF, 0xC2, 0x00, 0x00, 0x02, 0x81, 0x00}
-		setProtocol := []byte{0xFF, 0xC2, 0x00, 0x02, 0x04, 0x8F, 0x02, 0x00, 0x03}
-		endSession := []byte{0xFF, 0xC2, 0x00, 0x00, 0x02, 0x82, 0x00}
+	return results, nil
+}
 
-		// End any stale session first (ignore result)
-		card.Transmit(endSession)
+// writeUltralightPageOnCard writes a 4-byte page on an already-connected card,
+// trying each reader-specific write method in turn. Returns the method that worked.
+func writeUltralightPageOnCard(card *scard.Card, page int, data []byte) (int, error) {
+	// Try Method 1: Standard UPDATE BINARY (works on most readers)
+	writeCmd := []byte{0xFF, 0xD6, 0x00, byte(page), 0x04}
+	writeCmd = append(writeCmd, data...)
+	rsp, err := card.Transmit(writeCmd)
 
-		rsp, err = card.Transmit(startSession)
+	if err == nil && len(rsp) >= 2 && rsp[len(rsp)-2] == 0x90 && rsp[len(rsp)-1] == 0x00 {
+		return 1, nil
+	}
+
+	// Try Method 2: ACR122U InCommunicateThru
+	directCmd := []byte{0xFF, 0x00, 0x00, 0x00, 0x08, 0xD4, 0x42, 0xA2, byte(page)}
+	directCmd = append(directCmd, data...)
+	rsp, err = card.Transmit(directCmd)
+
+	if err == nil && len(rsp) >= 2 {
+		sw1, sw2 := rsp[len(rsp)-2], rsp[len(rsp)-1]
+		if sw1 == 0x90 && sw2 == 0x00 {
+			if len(rsp) >= 3 && rsp[0] == 0xD5 && rsp[1] == 0x43 && rsp[2] != 0x00 {
+				return 0, fmt.Errorf("card error %02X", rsp[2])
+			}
+			return 2, nil
+		}
+	}
+
+	// Try Method 3: ACR1552 Transparent Exchange with native WRITE command (0xA2)
+	startSession := []byte{0xFF, 0xC2, 0x00, 0x00, 0x02, 0x81, 0x00}
+	setProtocol := []byte{0xFF, 0xC2, 0x00, 0x02, 0x04, 0x8F, 0x02, 0x00, 0x03}
+	endSession := []byte{0xFF, 0xC2, 0x00, 0x00, 0x02, 0x82, 0x00}
+
+	// End any stale session first (ignore result)
+	card.Transmit(endSession)
+
+	rsp, err = card.Transmit(startSession)
+	if err == nil && len(rsp) >= 2 && rsp[len(rsp)-2] == 0x90 {
+		rsp, err = card.Transmit(setProtocol)
 		if err == nil && len(rsp) >= 2 && rsp[len(rsp)-2] == 0x90 {
-			rsp, err = card.Transmit(setProtocol)
-			if err == nil && len(rsp) >= 2 && rsp[len(rsp)-2] == 0x90 {
-				// Build transparent write command: A2 [page] [4 bytes]
-				writeData := []byte{0xA2, byte(p.Page)}
-				writeData = append(writeData, p.Data...)
-				// Wrap in transparent exchange: FF C2 00 01 [len+2] 95 [len] [data]
-				transparentCmd := []byte{0xFF, 0xC2, 0x00, 0x01, byte(len(writeData) + 2), 0x95, byte(len(writeData))}
-				transparentCmd = append(transparentCmd, writeData...)
+			// Build transparent write command: A2 [page] [4 bytes]
+			writeData := []byte{0xA2, byte(page)}
+			writeData = append(writeData, data...)
+			// Wrap in transparent exchange: FF C2 00 01 [len+2] 95 [len] [data]
+			transparentCmd := []byte{0xFF, 0xC2, 0x00, 0x01, byte(len(writeData) + 2), 0x95, byte(len(writeData))}
+			transparentCmd = append(transparentCmd, writeData...)
 
-				rsp, err = card.Transmit(transparentCmd)
-				card.Transmit(endSession) // Always end session
+			rsp, err = card.Transmit(transparentCmd)
+			card.Transmit(endSession) // Always end session
 
-				if err == nil && len(rsp) >= 2 && rsp[len(rsp)-2] == 0x90 {
-					results[i].Success = true
-					logging.Info(logging.CatCard, "Ultralight page written (batch)", map[string]any{
-						"page":   p.Page,
-						"data":   hex.EncodeToString(p.Data),
-						"method": 3,
-					})
-					continue
-				}
-			} else {
-				card.Transmit(endSession)
+			if err == nil && len(rsp) >= 2 && rsp[len(rsp)-2] == 0x90 {
+				return 3, nil
 			}
+		} else {
+			card.Transmit(endSession)
+		}
+	}
+
+	// All methods failed
+	if err != nil {
+		return 0, err
+	}
+	return 0, fmt.Errorf("write failed: status %02X %02X", rsp[len(rsp)-2], rsp[len(rsp)-1])
+}
+
+// UltralightReadResult represents the result of a single page read.
+type UltralightReadResult struct {
+	Page    int    `json:"page"`
+	Success bool   `json:"success"`
+	Data    string `json:"data,omitempty"` // Hex string, 8 chars = 4 bytes
+	Error   string `json:"error,omitempty"`
+}
+
+// ReadUltralightPages reads multiple pages from a MIFARE Ultralight / NTAG card
+// in a single card session. This is more efficient than multiple individual
+// ReadUltralightPage calls.
+func ReadUltralightPages(readerName string, pages []int, password []byte) ([]UltralightReadResult, error) {
+	if len(pages) == 0 {
+		return nil, fmt.Errorf("no pages to read")
+	}
+
+	// Validate all pages before connecting
+	for _, page := range pages {
+		if page < 0 || page > 255 {
+			return nil, fmt.Errorf("invalid page number: %d (must be 0-255)", page)
+		}
+	}
+
+	ctx, err := scard.EstablishContext()
+	if err != nil {
+		return nil, fmt.Errorf("failed to establish context: %w", err)
+	}
+	defer ctx.Release()
+
+	card, err := ctx.Connect(readerName, scard.ShareShared, scard.ProtocolAny)
+	if err != nil {
+		return nil, fmt.Errorf("failed to connect to reader: %w", err)
+	}
+	defer card.Disconnect(scard.LeaveCard)
+
+	// Authenticate with password if provided (for Ultralight EV1)
+	if len(password) > 0 {
+		if err := authenticateUltralight(card, password); err != nil {
+			return nil, err
 		}
+	}
+
+	results := make([]UltralightReadResult, len(pages))
+	for i, page := range pages {
+		results[i].Page = page
 
-		// All methods failed
+		data, err := readUltralightPageOnCard(card, page)
+		if err != nil {
+			results[i].Error = err.Error()
+			continue
+		}
+		results[i].Success = true
+		results[i].Data = hex.EncodeToString(data)
+	}
+
+	return results, nil
+}
+
+// UltralightTestCycleOp is one page in a write/verify/cleanup test cycle.
+type UltralightTestCycleOp struct {
+	Page    int    `json:"page"`
+	Write   []byte `json:"write"`   // Must be 4 bytes
+	Cleanup []byte `json:"cleanup"` // Optional, 4 bytes written after the read-back
+}
+
+// UltralightTestCycleResult represents the outcome of one page's test cycle.
+type UltralightTestCycleResult struct {
+	Page      int    `json:"page"`
+	Written   bool   `json:"written"`
+	Matches   bool   `json:"matches"`
+	CleanedUp bool   `json:"cleanedUp"`
+	Read      string `json:"read,omitempty"` // Hex string of the read-back data
+	Error     string `json:"error,omitempty"`
+}
+
+// RunUltralightTestCycle writes each page, reads it back and compares, then
+// writes the cleanup data, all in a single card session.
+func RunUltralightTestCycle(readerName string, ops []UltralightTestCycleOp, password []byte) ([]UltralightTestCycleResult, error) {
+	if len(ops) == 0 {
+		return nil, fmt.Errorf("no pages to test")
+	}
+
+	// Validate all pages before connecting
+	for _, op := range ops {
+		if op.Page < 0 || op.Page > 255 {
+			return nil, fmt.Errorf("invalid page number: %d (must be 0-255)", op.Page)
+		}
+		if op.Page < 4 {
+			return nil, fmt.Errorf("cannot write to system pages 0-3 (page %d)", op.Page)
+		}
+		if len(op.Write) != 4 {
+			return nil, fmt.Errorf("page %d: data must be exactly 4 bytes, got %d", op.Page, len(op.Write))
+		}
+		if len(op.Cleanup) != 0 && len(op.Cleanup) != 4 {
+			return nil, fmt.Errorf("page %d: cleanup data must be exactly 4 bytes, got %d", op.Page, len(op.Cleanup))
+		}
+	}
+
+	ctx, err := scard.EstablishContext()
+	if err != nil {
+		return nil, fmt.Errorf("failed to establish context: %w", err)
+	}
+	defer ctx.Release()
+
+	card, err := ctx.Connect(readerName, scard.ShareShared, scard.ProtocolAny)
+	if err != nil {
+		return nil, fmt.Errorf("failed to connect to reader: %w", err)
+	}
+	defer card.Disconnect(scard.LeaveCard)
+
+	// Authenticate with password if provided (for Ultralight EV1)
+	if len(password) > 0 {
+		if err := authenticateUltralight(card, password); err != nil {
+			return nil, err
+		}
+	}
+
+	results := make([]UltralightTestCycleResult, len(ops))
+	for i, op := range ops {
+		results[i].Page = op.Page
+
+		if _, err := writeUltralightPageOnCard(card, op.Page, op.Write); err != nil {
+			results[i].Error = err.Error()
+			continue
+		}
+		results[i].Written = true
+
+		data, err := readUltralightPageOnCard(card, op.Page)
 		if err != nil {
 			results[i].Error = err.Error()
 		} else {
-			results[i].Error = fmt.Sprintf("write failed: status %02X %02X", rsp[len(rsp)-2], rsp[len(rsp)-1])
+			results[i].Read = hex.EncodeToString(data)
+			results[i].Matches = bytes.Equal(data, op.Write)
+		}
+
+		if len(op.Cleanup) == 0 {
+			continue
+		}
+		if _, err := writeUltralightPageOnCard(card, op.Page, op.Cleanup); err != nil {
+			results[i].Error = err.Error()
+			continue
 		}
+		results[i].CleanedUp = true
 	}
 
+	logging.Info(logging.CatCard, "Ultralight test cycle complete", map[string]any{
+		"pages": len(ops),
+	})
+
 	return results, nil
 }
 
@@ -2399,15 +2580,18 @@ type MifareBlockWrite struct {
 
 // MifareWriteResult represents the result of a single block write.
 type MifareWriteResult struct {
-	Block   int    `json:"block"`
-	Success bool   `json:"success"`
-	Error   string `json:"error,omitempty"`
+	Block    int    `json:"block"`
+	Success  bool   `json:"success"`
+	ReadBack string `json:"readBack,omitempty"` // Hex string, set when verify is requested
+	Error    string `json:"error,omitempty"`
 }
 
 // WriteMifareBlocks writes multiple blocks to a MIFARE Classic card
 // in a single card session. This is more efficient and reliable than multiple
 // individual WriteMifareBlock calls. Re-authenticates when crossing sectors.
-func WriteMifareBlocks(readerName string, blocks []MifareBlockWrite, key []byte, keyType byte) ([]MifareWriteResult, error) {
+// If verify is set, each block is read back under the same authentication
+// and returned in ReadBack.
+func WriteMifareBlocks(readerName string, blocks []MifareBlockWrite, key []byte, keyType byte, verify bool) ([]MifareWriteResult, error) {
 	if len(blocks) == 0 {
 		return nil, fmt.Errorf("no blocks to write")
 	}
@@ -2464,17 +2648,8 @@ func WriteMifareBlocks(readerName string, blocks []MifareBlockWrite, key []byte,
 			lastAuthSector = sector
 		}
 
-		// Write block: FF D6 00 [block] 10 [16 bytes]
-		writeCmd := []byte{0xFF, 0xD6, 0x00, byte(b.Block), 0x10}
-		writeCmd = append(writeCmd, b.Data...)
-		rsp, err := card.Transmit(writeCmd)
-		if err != nil {
-			results[i].Error = fmt.Sprintf("transmit error: %v", err)
-			lastAuthSector = -1 // Force re-auth on next block
-			continue
-		}
-		if len(rsp) < 2 || rsp[len(rsp)-2] != 0x90 {
-			results[i].Error = fmt.Sprintf("write failed: status %02X %02X", rsp[len(rsp)-2], rsp[len(rsp)-1])
+		if err := transmitMifareWrite(card, b.Block, b.Data); err != nil {
+			results[i].Error = err.Error()
 			lastAuthSector = -1 // Force re-auth on next block
 			continue
 		}
@@ -2484,8 +2659,248 @@ func WriteMifareBlocks(readerName string, blocks []MifareBlockWrite, key []byte,
 			"block": b.Block,
 			"data":  hex.EncodeToString(b.Data),
 		})
+
+		if verify {
+			data, err := transmitMifareRead(card, b.Block)
+			if err != nil {
+				results[i].Error = fmt.Sprintf("read-back failed: %v", err)
+				lastAuthSector = -1 // Force re-auth on next block
+				continue
+			}
+			results[i].ReadBack = hex.EncodeToString(data)
+		}
+	}
+
+	return results, nil
+}
+
+// transmitMifareWrite writes a 16-byte block to a sector that is already authenticated.
+func transmitMifareWrite(card *scard.Card, block int, data []byte) error {
+	// Write block: FF D6 00 [block] 10 [16 bytes]
+	writeCmd := []byte{0xFF, 0xD6, 0x00, byte(block), 0x10}
+	writeCmd = append(writeCmd, data...)
+	rsp, err := card.Transmit(writeCmd)
+	if err != nil {
+		return fmt.Errorf("transmit error: %v", err)
+	}
+	if len(rsp) < 2 || rsp[len(rsp)-2] != 0x90 {
+		if len(rsp) < 2 {
+			return fmt.Errorf("write failed: short response")
+		}
+		return fmt.Errorf("write failed: status %02X %02X", rsp[len(rsp)-2], rsp[len(rsp)-1])
+	}
+	return nil
+}
+
+// MifareReadResult represents the result of a single block read.
+type MifareReadResult struct {
+	Block   int    `json:"block"`
+	Success bool   `json:"success"`
+	Data    string `json:"data,omitempty"` // Hex string, 32 chars = 16 bytes
+	Error   string `json:"error,omitempty"`
+}
+
+// ReadMifareBlocks reads multiple blocks from a MIFARE Classic card
+// in a single card session, authenticating once per sector instead of once
+// per block. Re-authenticates when crossing sectors.
+func ReadMifareBlocks(readerName string, blocks []int, key []byte, keyType byte) ([]MifareReadResult, error) {
+	if len(blocks) == 0 {
+		return nil, fmt.Errorf("no blocks to read")
+	}
+
+	// Validate all blocks before connecting
+	for _, block := range blocks {
+		if block < 0 || block > 255 {
+			return nil, fmt.Errorf("invalid block number: %d (must be 0-255)", block)
+		}
+		if isSectorTrailer(block) {
+			return nil, fmt.Errorf("cannot read sector trailer block %d", block)
+		}
+	}
+
+	ctx, err := scard.EstablishContext()
+	if err != nil {
+		return nil, fmt.Errorf("failed to establish context: %w", err)
+	}
+	defer ctx.Release()
+
+	card, err := ctx.Connect(readerName, scard.ShareShared, scard.ProtocolAny)
+	if err != nil {
+		return nil, fmt.Errorf("failed to connect to reader: %w", err)
+	}
+	defer card.Disconnect(scard.LeaveCard)
+
+	// Convert key type character to APDU byte
+	var keyTypeByte byte = 0x60 // Default Key A
+	if keyType == 'B' || keyType == 'b' || keyType == 0x61 {
+		keyTypeByte = 0x61
 	}
 
+	results := make([]MifareReadResult, len(blocks))
+	lastAuthSector := -1
+
+	for i, block := range blocks {
+		results[i].Block = block
+
+		// Calculate sector for this block
+		sector := block / 4
+		if block >= 128 {
+			sector = 32 + (block-128)/16
+		}
+
+		// Re-authenticate if sector changed
+		if sector != lastAuthSector {
+			if err := authenticateMifareBlock(card, block, key, keyTypeByte); err != nil {
+				results[i].Error = err.Error()
+				lastAuthSector = -1
+				continue
+			}
+			lastAuthSector = sector
+		}
+
+		data, err := transmitMifareRead(card, block)
+		if err != nil {
+			results[i].Error = err.Error()
+			lastAuthSector = -1 // Force re-auth on next block
+			continue
+		}
+
+		results[i].Success = true
+		results[i].Data = hex.EncodeToString(data)
+		logging.Info(logging.CatCard, "MIFARE block read (batch)", map[string]any{
+			"block": block,
+			"data":  results[i].Data,
+		})
+	}
+
+	return results, nil
+}
+
+// MifareTestCycleOp is one block in a write/verify/cleanup test cycle.
+type MifareTestCycleOp struct {
+	Block   int    `json:"block"`
+	Write   []byte `json:"write"`   // Must be 16 bytes
+	Cleanup []byte `json:"cleanup"` // Optional, 16 bytes written after the read-back
+}
+
+// MifareTestCycleResult represents the outcome of one block's test cycle.
+type MifareTestCycleResult struct {
+	Block     int    `json:"block"`
+	Written   bool   `json:"written"`
+	Matches   bool   `json:"matches"`
+	CleanedUp bool   `json:"cleanedUp"`
+	Read      string `json:"read,omitempty"` // Hex string of the read-back data
+	Error     string `json:"error,omitempty"`
+}
+
+// RunMifareTestCycle writes each block, reads it back and compares, then writes
+// the cleanup data, all in a single card session. Authenticates once per sector
+// and re-authenticates when crossing sectors or after a failed command.
+func RunMifareTestCycle(readerName string, ops []MifareTestCycleOp, key []byte, keyType byte) ([]MifareTestCycleResult, error) {
+	if len(ops) == 0 {
+		return nil, fmt.Errorf("no blocks to test")
+	}
+
+	// Validate all blocks before connecting
+	for _, op := range ops {
+		if op.Block < 0 || op.Block > 255 {
+			return nil, fmt.Errorf("invalid block number: %d (must be 0-255)", op.Block)
+		}
+		if isSectorTrailer(op.Block) {
+			return nil, fmt.Errorf("cannot write to sector trailer block %d", op.Block)
+		}
+		if len(op.Write) != 16 {
+			return nil, fmt.Errorf("block %d: data must be exactly 16 bytes, got %d", op.Block, len(op.Write))
+		}
+		if len(op.Cleanup) != 0 && len(op.Cleanup) != 16 {
+			return nil, fmt.Errorf("block %d: cleanup data must be exactly 16 bytes, got %d", op.Block, len(op.Cleanup))
+		}
+	}
+
+	ctx, err := scard.EstablishContext()
+	if err != nil {
+		return nil, fmt.Errorf("failed to establish context: %w", err)
+	}
+	defer ctx.Release()
+
+	card, err := ctx.Connect(readerName, scard.ShareShared, scard.ProtocolAny)
+	if err != nil {
+		return nil, fmt.Errorf("failed to connect to reader: %w", err)
+	}
+	defer card.Disconnect(scard.LeaveCard)
+
+	// Convert key type character to APDU byte
+	var keyTypeByte byte = 0x60 // Default Key A
+	if keyType == 'B' || keyType == 'b' || keyType == 0x61 {
+		keyTypeByte = 0x61
+	}
+
+	results := make([]MifareTestCycleResult, len(ops))
+	lastAuthSector := -1
+
+	// ensureAuth authenticates the block's sector unless it already is
+	ensureAuth := func(block int) error {
+		sector := block / 4
+		if block >= 128 {
+			sector = 32 + (block-128)/16
+		}
+		if sector == lastAuthSector {
+			return nil
+		}
+		if err := authenticateMifareBlock(card, block, key, keyTypeByte); err != nil {
+			lastAuthSector = -1
+			return err
+		}
+		lastAuthSector = sector
+		return nil
+	}
+
+	for i, op := range ops {
+		results[i].Block = op.Block
+
+		if err := ensureAuth(op.Block); err != nil {
+			results[i].Error = err.Error()
+			continue
+		}
+		if err := transmitMifareWrite(card, op.Block, op.Write); err != nil {
+			results[i].Error = err.Error()
+			lastAuthSector = -1 // Force re-auth on next command
+			continue
+		}
+		results[i].Written = true
+
+		if err := ensureAuth(op.Block); err != nil {
+			results[i].Error = err.Error()
+			continue
+		}
+		data, err := transmitMifareRead(card, op.Block)
+		if err != nil {
+			results[i].Error = err.Error()
+			lastAuthSector = -1
+		} else {
+			results[i].Read = hex.EncodeToString(data)
+			results[i].Matches = bytes.Equal(data, op.Write)
+		}
+
+		if len(op.Cleanup) == 0 {
+			continue
+		}
+		if err := ensureAuth(op.Block); err != nil {
+			results[i].Error = err.Error()
+			continue
+		}
+		if err := transmitMifareWrite(card, op.Block, op.Cleanup); err != nil {
+			results[i].Error = err.Error()
+			lastAuthSector = -1
+			continue
+		}
+		results[i].CleanedUp = true
+	}
+
+	logging.Info(logging.CatCard, "MIFARE test cycle complete", map[string]any{
+		"blocks": len(ops),
+	})
+
 	return results, nil
 }
 
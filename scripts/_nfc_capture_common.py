@@ -0,0 +1,231 @@
+"""
+Shared helpers for the NFC tag capture scripts.
+
+auto_capture.py, capture_one.py and capture_tag_data.py all talk to the
+NFC Agent WebSocket API, parse the APDU capture log written when the agent
+runs with NFC_CAPTURE_LOG=1, and save the result as a regression fixture
+under internal/core/testdata. This module holds the parts they share.
+"""
+
+import asyncio
+import contextlib
+import functools
+import mmap
+import os
+import re
+import sys
+from pathlib import Path
+
+try:
+    import orjson
+    import websockets
+except ImportError:
+    print("Error: orjson and websockets libraries required. Install with: pip3 install orjson 'websockets>=14'")
+    sys.exit(1)
+
+# Configuration
+WS_URL = "ws://127.0.0.1:32145/v1/ws"
+# Localhost JSON frames are small; skip permessage-deflate and keepalive pings
+WS_OPTIONS = {"compression": None, "max_size": 2**20, "ping_interval": None, "ping_timeout": None}
+CAPTURE_LOG = Path("nfc_capture.log")
+TESTDATA_DIR = Path("internal/core/testdata")
+DAEMON_SOCKET = "/tmp/nfc_capture.sock"
+
+# Capture log line format: timestamp | method | cmd=xxx | rsp=xxx
+_LINE_RE = re.compile(rb"^[^|\n]*\| ([^|\n]+) \| cmd=([^|\n]*) \| rsp=(.*)$", re.MULTILINE)
+
+# Reader ID mapping (normalized names), checked in order
+READER_IDS = (
+    ("1552", "acr1552u"),
+    ("1252", "acr1252u"),
+    ("122U", "acr122u"),
+)
+
+
+@functools.lru_cache(maxsize=None)
+def get_reader_id(reader_name: str) -> str:
+    """Extract reader ID from full reader name."""
+    reader_upper = reader_name.upper()
+    reader_id = next((value for key, value in READER_IDS if key in reader_upper), None)
+    if reader_id:
+        return reader_id
+    # Fallback: sanitize the name
+    return reader_name.lower().replace(" ", "_").replace("/", "_")[:20]
+
+
+def parse_capture_log() -> dict:
+    """Parse the capture log file and return {"cmd", "rsp"} entries by method."""
+    responses = {}
+    if not CAPTURE_LOG.exists():
+        return responses
+
+    with open(CAPTURE_LOG, 'rb') as f:
+        # mmap refuses zero-length files
+        if os.fstat(f.fileno()).st_size == 0:
+            return responses
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            for m in _LINE_RE.finditer(mm):
+                # Method names repeat across every capture; share one str per name
+                responses[sys.intern(m.group(1).strip().lower().decode())] = {
+                    "cmd": m.group(2).strip().decode(),
+                    "rsp": m.group(3).strip().decode(),
+                }
+        finally:
+            mm.close()
+
+    return responses
+
+
+def clear_capture_log():
+    """Clear the capture log file."""
+    if CAPTURE_LOG.exists():
+        CAPTURE_LOG.unlink()
+
+
+async def wait_for_log_quiescent(path: Path = CAPTURE_LOG, quiet_ms: int = 50, max_ms: int = 500):
+    """Wait until the capture log has stopped growing for quiet_ms (at most max_ms)."""
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + max_ms / 1000
+    last_size, last_change = None, loop.time()
+    while loop.time() < deadline:
+        size = path.stat().st_size if path.exists() else 0
+        if size != last_size:
+            last_size, last_change = size, loop.time()
+        elif loop.time() - last_change >= quiet_ms / 1000:
+            return
+        await asyncio.sleep(0.02)
+
+
+def output_dir_for(reader_id: str) -> Path:
+    """Return the testdata directory for a reader, creating it if needed."""
+    output_dir = TESTDATA_DIR / reader_id
+    output_dir.mkdir(parents=True, exist_ok=True)
+    return output_dir
+
+
+def is_plain_file_stem(name: str) -> bool:
+    """True if name can be used as a fixture file name without leaving its directory."""
+    return bool(name) and name not in (".", "..") and Path(name).name == name and "\\" not in name
+
+
+def save_capture(output_dir: Path, reader_id: str, tag_file: str, tag_display: str, card: dict,
+                 responses: dict, reader_name: str, captured_at: str) -> Path:
+    """Save captured data to a JSON fixture and return its path."""
+    if not is_plain_file_stem(tag_file):
+        raise ValueError(f"invalid tag file name: {tag_file!r}")
+    output_file = output_dir / f"{tag_file}.json"
+
+    capture_data = {
+        "reader": reader_name,
+        "reader_id": reader_id,
+        "tag_type": tag_display,
+        "uid": card.get("uid", ""),
+        "atr": card.get("atr", ""),
+        "protocol": card.get("protocol", ""),
+        "protocol_iso": card.get("protocolISO", ""),
+        # Fixtures only keep the raw responses
+        "responses": {method: data["rsp"] for method, data in responses.items()},
+        "detected_type": card.get("type", ""),
+        "detected_size": card.get("size", 0),
+        "captured_at": captured_at,
+    }
+
+    # Single unbuffered write; loop only in case the kernel writes short
+    payload = memoryview(orjson.dumps(capture_data, option=orjson.OPT_INDENT_2))
+    fd = os.open(output_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        while payload:
+            payload = payload[os.write(fd, payload):]
+    finally:
+        os.close(fd)
+    return output_file
+
+
+def _subscribe_msg(reader_index: int, interval_ms: int) -> str:
+    return orjson.dumps({
+        "type": "subscribe",
+        "id": "sub-1",
+        "payload": {
+            "readerIndex": reader_index,
+            "intervalMs": interval_ms
+        }
+    }).decode()
+
+
+def connect():
+    """Open a WebSocket connection to the NFC Agent."""
+    return websockets.connect(WS_URL, **WS_OPTIONS)
+
+
+@contextlib.asynccontextmanager
+async def connect_and_list(subscribe_index: int | None = None, interval_ms: int = 500):
+    """
+    Connect, list readers and optionally subscribe to one of them.
+
+    Yields (ws, readers). When subscribe_index is given, list_readers and
+    subscribe are sent together; the agent handles messages in order, so the
+    replies arrive in the same order. A subscribe error is ignored here since
+    it only happens when there are no readers, which the caller checks.
+    """
+    async with connect() as ws:
+        list_msg = orjson.dumps({"type": "list_readers", "id": "list-1"}).decode()
+        if subscribe_index is None:
+            await ws.send(list_msg)
+        else:
+            await asyncio.gather(ws.send(list_msg), ws.send(_subscribe_msg(subscribe_index, interval_ms)))
+
+        data = orjson.loads(await ws.recv(decode=False))
+        if subscribe_index is not None:
+            await ws.recv()
+
+        if data.get("error"):
+            print(f"Error listing readers: {data['error']}")
+            readers = []
+        else:
+            readers = data.get("payload") or []
+
+        yield ws, readers
+
+
+async def subscribe(ws, reader_index: int, interval_ms: int = 500) -> bool:
+    """Subscribe to card detection events for a reader."""
+    await ws.send(_subscribe_msg(reader_index, interval_ms))
+
+    response = await ws.recv(decode=False)
+    data = orjson.loads(response)
+
+    if data.get("error"):
+        print(f"Error subscribing: {data['error']}")
+        return False
+
+    return True
+
+
+async def daemon_capture(tag_file: str, tag_name: str, timeout: float = 60.0) -> dict:
+    """Ask a running _nfc_capture_daemon.py to capture the next tag."""
+    reader, writer = await asyncio.open_unix_connection(DAEMON_SOCKET)
+    try:
+        req = {"cmd": "capture_next", "tag_file": tag_file, "tag_name": tag_name, "timeout": timeout}
+        writer.write(orjson.dumps(req) + b"\n")
+        await writer.drain()
+        reply = await reader.readline()
+        if not reply:
+            return {"ok": False, "error": "capture daemon closed the connection without replying"}
+        try:
+            return orjson.loads(reply)
+        except orjson.JSONDecodeError:
+            return {"ok": False, "error": "invalid reply from capture daemon"}
+    finally:
+        writer.close()
+
+
+def run(main):
+    """Run an async entry point, on uvloop when it is installed."""
+    # uvloop is optional; fall back to the default event loop without it
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+    asyncio.run(main())
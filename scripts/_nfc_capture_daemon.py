@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+NFC Capture Daemon
+
+Holds one subscribed WebSocket connection to the NFC Agent and serves
+capture requests from auto_capture.py / capture_one.py over a Unix socket,
+so repeated batch runs don't pay the connect + subscribe cost each time.
+
+Usage:
+    1. Start nfc-agent with: NFC_CAPTURE_LOG=1 ./nfc-agent
+    2. Start the daemon: python3 scripts/_nfc_capture_daemon.py [reader_index]
+    3. Run the capture scripts with --daemon
+
+Protocol: one JSON object per line in each direction. The client sends
+{"cmd": "capture_next", "tag_file": ..., "tag_name": ..., "timeout": ...}
+and receives {"ok": true, "file": ..., "card": ..., "responses": N,
+"reader": ..., "reader_id": ...} or {"ok": false, "error": ...}.
+"""
+
+import asyncio
+import os
+import sys
+from datetime import datetime
+
+from _nfc_capture_common import (
+    DAEMON_SOCKET, clear_capture_log, connect_and_list, get_reader_id, is_plain_file_stem,
+    output_dir_for, parse_capture_log, run, save_capture, wait_for_log_quiescent,
+)
+import orjson
+
+
+class CaptureDaemon:
+    """Routes card events from one WebSocket to queued capture requests."""
+
+    def __init__(self, ws, reader_name: str):
+        self.ws = ws
+        self.reader_name = reader_name
+        self.reader_id = get_reader_id(reader_name)
+        self.output_dir = output_dir_for(self.reader_id)
+        self.cards: asyncio.Queue = asyncio.Queue()
+        # One capture at a time: they share the capture log
+        self.lock = asyncio.Lock()
+
+    async def pump_events(self):
+        """Forward card_detected events from the agent into the queue."""
+        while True:
+            data = orjson.loads(await self.ws.recv(decode=False))
+            if data.get("type") == "card_detected":
+                card = data.get("payload", {}).get("card", {})
+                if card.get("uid"):
+                    await self.cards.put(card)
+
+    async def capture_next(self, tag_file: str, tag_name: str, timeout: float,
+                           client_gone: asyncio.Future) -> dict | None:
+        """
+        Wait for the next tag placed on the reader and save its fixture.
+
+        Returns None without saving if client_gone completes first, so a
+        request whose client has disconnected never writes a fixture.
+        """
+        async with self.lock:
+            if client_gone.done():
+                return None
+
+            # Drop tags detected before this request
+            while not self.cards.empty():
+                self.cards.get_nowait()
+            clear_capture_log()
+
+            next_card = asyncio.ensure_future(self.cards.get())
+            try:
+                await asyncio.wait({next_card, client_gone}, timeout=timeout,
+                                   return_when=asyncio.FIRST_COMPLETED)
+            finally:
+                if not next_card.done():
+                    next_card.cancel()
+            if client_gone.done():
+                return None
+            if not next_card.done() or next_card.cancelled():
+                return {"ok": False, "error": "timeout waiting for tag"}
+            card = next_card.result()
+
+            captured_at = datetime.now().isoformat()
+            await wait_for_log_quiescent()
+            if client_gone.done():
+                clear_capture_log()
+                return None
+
+            responses = parse_capture_log()
+            output_file = save_capture(self.output_dir, self.reader_id, tag_file, tag_name, card,
+                                       responses, self.reader_name, captured_at)
+            clear_capture_log()
+
+            return {
+                "ok": True,
+                "file": str(output_file),
+                "card": card,
+                "responses": len(responses),
+                "reader": self.reader_name,
+                "reader_id": self.reader_id,
+            }
+
+    async def handle_request(self, line: bytes, reader: asyncio.StreamReader) -> dict | None:
+        """Run one request line; returns the reply, or None if the client went away."""
+        try:
+            req = orjson.loads(line)
+        except orjson.JSONDecodeError:
+            return {"ok": False, "error": "invalid request"}
+        if not isinstance(req, dict):
+            return {"ok": False, "error": "invalid request"}
+
+        if req.get("cmd") != "capture_next":
+            return {"ok": False, "error": f"unknown command: {req.get('cmd')}"}
+
+        try:
+            timeout = float(req.get("timeout", 60))
+        except (TypeError, ValueError):
+            return {"ok": False, "error": f"invalid timeout: {req.get('timeout')!r}"}
+
+        # The name becomes <testdata>/<reader>/<tag_file>.json, so no paths
+        tag_file = req.get("tag_file", "unknown")
+        if not isinstance(tag_file, str) or not is_plain_file_stem(tag_file):
+            return {"ok": False, "error": f"invalid tag_file: {tag_file!r}"}
+
+        # Clients send nothing while waiting, so read() only returns at EOF,
+        # i.e. when the client disconnects (Ctrl-C, crash)
+        client_gone = asyncio.ensure_future(reader.read())
+        try:
+            return await self.capture_next(tag_file, str(req.get("tag_name", "")), timeout, client_gone)
+        except Exception as e:
+            return {"ok": False, "error": f"capture failed: {e}"}
+        finally:
+            # Let the cancelled read unwind before the next readline()
+            client_gone.cancel()
+            await asyncio.wait({client_gone})
+
+    async def handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while line := await reader.readline():
+                result = await self.handle_request(line, reader)
+                if result is None:
+                    break
+                writer.write(orjson.dumps(result) + b"\n")
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+
+async def socket_in_use(path: str) -> bool:
+    """True if another process is accepting connections on the Unix socket."""
+    try:
+        _, writer = await asyncio.open_unix_connection(path)
+    except OSError:
+        return False
+    writer.close()
+    return True
+
+
+async def main():
+    reader_index = int(sys.argv[1]) if len(sys.argv) > 1 else 0
+
+    if await socket_in_use(DAEMON_SOCKET):
+        print(f"Another capture daemon is already listening on {DAEMON_SOCKET}")
+        sys.exit(1)
+
+    async with connect_and_list(subscribe_index=reader_index) as (ws, readers):
+        if not 0 <= reader_index < len(readers):
+            print("No such reader!")
+            sys.exit(1)
+
+        daemon = CaptureDaemon(ws, readers[reader_index].get("name", "Unknown"))
+        print(f"Reader: {daemon.reader_name} ({daemon.reader_id})")
+
+        # Nothing answered above, so any socket file left is stale
+        if os.path.exists(DAEMON_SOCKET):
+            os.unlink(DAEMON_SOCKET)
+        server = await asyncio.start_unix_server(daemon.handle_client, path=DAEMON_SOCKET)
+        print(f"Listening on {DAEMON_SOCKET}")
+
+        try:
+            async with server:
+                await asyncio.gather(server.serve_forever(), daemon.pump_events())
+        finally:
+            if os.path.exists(DAEMON_SOCKET):
+                os.unlink(DAEMON_SOCKET)
+
+
+if __name__ == "__main__":
+    try:
+        run(main)
+    except KeyboardInterrupt:
+        pass
@@ -12,22 +12,16 @@ Usage:
 """
 
 import asyncio
-import json
-import os
 import sys
 from datetime import datetime
-from pathlib import Path
 
-try:
-    import websockets
-except ImportError:
-    print("Error: websockets library required. Install with: pip3 install websockets")
-    sys.exit(1)
-
-# Configuration
-WS_URL = "ws://127.0.0.1:32145/v1/ws"
-CAPTURE_LOG = Path("nfc_capture.log")
-TESTDATA_DIR = Path("internal/core/testdata")
+# Checks that orjson and websockets are installed
+from _nfc_capture_common import (
+    TESTDATA_DIR, clear_capture_log, connect, connect_and_list, get_reader_id,
+    output_dir_for, parse_capture_log, run, save_capture, subscribe,
+    wait_for_log_quiescent,
+)
+import orjson
 
 # Tag types to capture (in order)
 TAG_TYPES = [
@@ -39,99 +33,6 @@ TAG_TYPES = [
     ("MIFARE Ultralight", "mifare_ultralight"),
 ]
 
-# Reader ID mapping (normalized names)
-READER_IDS = {
-    "ACR1552": "acr1552u",
-    "ACR122U": "acr122u",
-    "ACR1252": "acr1252u",
-}
-
-
-def get_reader_id(reader_name: str) -> str:
-    """Extract reader ID from full reader name."""
-    reader_upper = reader_name.upper()
-    for key, value in READER_IDS.items():
-        if key in reader_upper:
-            return value
-    # Fallback: sanitize the name
-    return reader_name.lower().replace(" ", "_").replace("/", "_")[:20]
-
-
-def parse_capture_log() -> dict:
-    """Parse the capture log file and return responses by method."""
-    responses = {}
-    if not CAPTURE_LOG.exists():
-        return responses
-
-    with open(CAPTURE_LOG, 'r') as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            # Format: timestamp | method | cmd=xxx | rsp=xxx
-            parts = line.split(" | ")
-            if len(parts) >= 4:
-                method = parts[1]
-                cmd_part = parts[2]
-                rsp_part = parts[3]
-
-                cmd = cmd_part.replace("cmd=", "")
-                rsp = rsp_part.replace("rsp=", "")
-
-                responses[method.lower()] = {
-                    "cmd": cmd,
-                    "rsp": rsp,
-                }
-
-    return responses
-
-
-def clear_capture_log():
-    """Clear the capture log file."""
-    if CAPTURE_LOG.exists():
-        CAPTURE_LOG.unlink()
-
-
-async def list_readers(ws) -> list:
-    """Get list of connected readers."""
-    msg = {
-        "type": "list_readers",
-        "id": "list-1"
-    }
-    await ws.send(json.dumps(msg))
-
-    response = await ws.recv()
-    data = json.loads(response)
-
-    if data.get("error"):
-        print(f"Error listing readers: {data['error']}")
-        return []
-
-    readers = json.loads(data.get("payload", "[]"))
-    return readers
-
-
-async def subscribe_to_reader(ws, reader_index: int):
-    """Subscribe to card detection events for a reader."""
-    msg = {
-        "type": "subscribe",
-        "id": "sub-1",
-        "payload": {
-            "readerIndex": reader_index,
-            "intervalMs": 500
-        }
-    }
-    await ws.send(json.dumps(msg))
-
-    response = await ws.recv()
-    data = json.loads(response)
-
-    if data.get("error"):
-        print(f"Error subscribing: {data['error']}")
-        return False
-
-    return True
-
 
 async def unsubscribe_from_reader(ws, reader_index: int):
     """Unsubscribe from card detection events."""
@@ -142,7 +43,7 @@ async def unsubscribe_from_reader(ws, reader_index: int):
             "readerIndex": reader_index
         }
     }
-    await ws.send(json.dumps(msg))
+    await ws.send(orjson.dumps(msg).decode())
     await ws.recv()
 
 
@@ -150,12 +51,11 @@ async def wait_for_card(ws, timeout: float = 60.0) -> dict | None:
     """Wait for a card to be detected."""
     try:
         while True:
-            response = await asyncio.wait_for(ws.recv(), timeout=timeout)
-            data = json.loads(response)
+            response = await asyncio.wait_for(ws.recv(decode=False), timeout=timeout)
+            data = orjson.loads(response)
 
             if data.get("type") == "card_detected":
-                payload = json.loads(data.get("payload", "{}"))
-                return payload.get("card")
+                return data.get("payload", {}).get("card")
     except asyncio.TimeoutError:
         return None
 
@@ -164,8 +64,8 @@ async def wait_for_card_removal(ws, timeout: float = 30.0):
     """Wait for a card to be removed."""
     try:
         while True:
-            response = await asyncio.wait_for(ws.recv(), timeout=timeout)
-            data = json.loads(response)
+            response = await asyncio.wait_for(ws.recv(decode=False), timeout=timeout)
+            data = orjson.loads(response)
 
             if data.get("type") == "card_removed":
                 return True
@@ -173,36 +73,41 @@ async def wait_for_card_removal(ws, timeout: float = 30.0):
         return False
 
 
-def save_capture_data(reader_id: str, tag_file: str, card_data: dict, responses: dict, reader_name: str, tag_display: str):
-    """Save captured data to JSON file."""
-    output_dir = TESTDATA_DIR / reader_id
-    output_dir.mkdir(parents=True, exist_ok=True)
-
-    output_file = output_dir / f"{tag_file}.json"
-
-    # Build the capture data structure
-    capture_data = {
-        "reader": reader_name,
-        "reader_id": reader_id,
-        "tag_type": tag_display,
-        "uid": card_data.get("uid", ""),
-        "atr": card_data.get("atr", ""),
-        "protocol": card_data.get("protocol", ""),
-        "protocol_iso": card_data.get("protocolISO", ""),
-        "responses": {},
-        "detected_type": card_data.get("type", ""),
-        "detected_size": card_data.get("size", 0),
-        "captured_at": datetime.now().isoformat(),
-    }
+async def ainput(prompt: str) -> str:
+    """
+    input() that waits on the event loop instead of blocking it.
 
-    # Add raw responses
-    for method, data in responses.items():
-        capture_data["responses"][method] = data["rsp"]
+    Ctrl-C then cancels the pending prompt like any other await. Plain input()
+    inside asyncio.run ignores the first Ctrl-C, and a worker thread would keep
+    asyncio.run from exiting until Enter is pressed.
 
-    with open(output_file, 'w') as f:
-        json.dump(capture_data, f, indent=2)
+    Falls back to plain input() for piped stdin and on event loops that cannot
+    watch stdin (Windows: the Proactor loop has no add_reader, and the selector
+    loop only accepts sockets).
+    """
+    if not sys.stdin.isatty() or sys.platform == "win32":
+        return input(prompt)
 
-    print(f"    Saved to: {output_file}")
+    loop = asyncio.get_running_loop()
+    line = loop.create_future()
+
+    def on_readable():
+        if not line.done():
+            line.set_result(sys.stdin.readline())
+
+    try:
+        loop.add_reader(sys.stdin.fileno(), on_readable)
+    except NotImplementedError:
+        return input(prompt)
+
+    print(prompt, end="", flush=True)
+    try:
+        result = await line
+    finally:
+        loop.remove_reader(sys.stdin.fileno())
+    if not result:
+        raise EOFError
+    return result.rstrip("\n")
 
 
 async def capture_tags_for_reader(reader_name: str, reader_index: int, skip_iso15693: bool = False):
@@ -213,9 +118,11 @@ async def capture_tags_for_reader(reader_name: str, reader_index: int, skip_iso1
     print(f"Reader ID: {reader_id}")
     print(f"{'='*60}")
 
-    async with websockets.connect(WS_URL) as ws:
+    output_dir = output_dir_for(reader_id)
+
+    async with connect() as ws:
         # Subscribe to card events
-        if not await subscribe_to_reader(ws, reader_index):
+        if not await subscribe(ws, reader_index):
             print("Failed to subscribe to reader")
             return
 
@@ -229,7 +136,7 @@ async def capture_tags_for_reader(reader_name: str, reader_index: int, skip_iso1
             # Clear capture log before scanning
             clear_capture_log()
 
-            input(f"Place {tag_display} on the reader and press Enter...")
+            await ainput(f"Place {tag_display} on the reader and press Enter...")
 
             # Wait for card detection
             print("  Waiting for card...")
@@ -237,14 +144,16 @@ async def capture_tags_for_reader(reader_name: str, reader_index: int, skip_iso1
 
             if not card_data:
                 print(f"  ERROR: No card detected within timeout")
-                retry = input("  Retry? (y/n): ")
+                retry = await ainput("  Retry? (y/n): ")
                 if retry.lower() == 'y':
                     card_data = await wait_for_card(ws, timeout=30.0)
                 if not card_data:
                     continue
 
-            # Give a moment for all APDU commands to complete and be logged
-            await asyncio.sleep(0.5)
+            captured_at = datetime.now().isoformat()
+
+            # Wait for all APDU commands to complete and be logged
+            await wait_for_log_quiescent()
 
             # Read capture log
             responses = parse_capture_log()
@@ -260,12 +169,13 @@ async def capture_tags_for_reader(reader_name: str, reader_index: int, skip_iso1
             expected = tag_display.upper().replace(" 1K", "")
             if expected not in detected and detected not in expected:
                 print(f"  WARNING: Detected type '{card_data.get('type')}' doesn't match expected '{tag_display}'")
-                confirm = input("  Save anyway? (y/n): ")
+                confirm = await ainput("  Save anyway? (y/n): ")
                 if confirm.lower() != 'y':
                     continue
 
             # Save capture data
-            save_capture_data(reader_id, tag_file, card_data, responses, reader_name, tag_display)
+            output_file = save_capture(output_dir, reader_id, tag_file, tag_display, card_data, responses, reader_name, captured_at)
+            print(f"    Saved to: {output_file}")
 
             # Wait for card removal
             print("  Remove the card...")
@@ -289,8 +199,8 @@ async def main():
 
     # Connect and list readers
     try:
-        async with websockets.connect(WS_URL) as ws:
-            readers = await list_readers(ws)
+        async with connect_and_list() as (_, readers):
+            pass
     except Exception as e:
         print(f"Error connecting to NFC Agent: {e}")
         print("Make sure nfc-agent is running with: NFC_CAPTURE_LOG=1 ./nfc-agent")
@@ -308,7 +218,7 @@ async def main():
     # Select reader
     while True:
         try:
-            selection = input("Select reader index (or 'all' for all readers): ")
+            selection = await ainput("Select reader index (or 'all' for all readers): ")
             if selection.lower() == 'all':
                 selected_indices = list(range(len(readers)))
                 break
@@ -340,4 +250,8 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    try:
+        run(main)
+    except KeyboardInterrupt:
+        print("\nCapture cancelled")
+        sys.exit(130)
@@ -1,30 +1,83 @@
 #!/usr/bin/env python3
 """Test script for MIFARE Ultralight and MIFARE Classic write operations."""
 
+import orjson
 import requests
+import socket
 import sys
+from requests.adapters import HTTPAdapter
 
 BASE_URL = "http://127.0.0.1:32145/v1"
 
+# Small JSON requests to localhost: no Nagle delay, and keep idle connections alive
+_SOCKET_OPTIONS = [
+    (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+    (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+]
+
+class _LowLatencyAdapter(HTTPAdapter):
+    """HTTPAdapter that applies _SOCKET_OPTIONS to every pooled connection."""
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs["socket_options"] = _SOCKET_OPTIONS
+        super().init_poolmanager(*args, **kwargs)
+
+# One keep-alive connection pool for every call to the agent
+SESSION = requests.Session()
+SESSION.mount("http://", _LowLatencyAdapter(pool_connections=1, pool_maxsize=8, max_retries=0))
+
+# (connect, read) seconds, so a stuck reader fails the run instead of hanging it
+TIMEOUT = (2, 10)
+
+# Fixed test payloads, built once (hex already uppercase)
+_ULTRALIGHT_BATCH_PAGES = (
+    {"page": 11, "data": "11111111"},
+    {"page": 12, "data": "22222222"},
+    {"page": 13, "data": "33333333"},
+)
+_ULTRALIGHT_EXPECTED = {p["page"]: p["data"] for p in _ULTRALIGHT_BATCH_PAGES}
+_ULTRALIGHT_CLEANUP_PAGES = tuple({"page": page, "data": "00000000"} for page in (10, 11, 12, 13))
+
+_ZERO_BLOCK = "0" * 32
+
+# Blocks 4, 5 in sector 1 and block 8 in sector 2
+_BATCH_BLOCKS = (
+    {"block": 4, "data": "AAAABBBBCCCCDDDDEEEEFFFFAAAABBBB"},
+    {"block": 5, "data": "11112222333344445555666677778888"},
+    {"block": 8, "data": "DEADBEEFDEADBEEFDEADBEEFDEADBEEF"},  # Different sector
+)
+_EXPECTED = {b["block"]: b["data"] for b in _BATCH_BLOCKS}
+_CLEANUP_BLOCKS = tuple({"block": b["block"], "data": _ZERO_BLOCK} for b in _BATCH_BLOCKS)
+
+def _request(method, url, **kw):
+    """Send a request on the shared session with the default timeout."""
+    kw.setdefault("timeout", TIMEOUT)
+    return SESSION.request(method, url, **kw)
+
+def _post(url, payload):
+    """POST a JSON payload, encoded with orjson."""
+    return _request("POST", url, data=orjson.dumps(payload), headers={"Content-Type": "application/json"})
+
 def get_readers():
     """Get list of available readers."""
-    resp = requests.get(f"{BASE_URL}/readers")
+    resp = _request("GET", f"{BASE_URL}/readers")
     resp.raise_for_status()
-    return resp.json()
+    return orjson.loads(resp.content)
 
 def get_card(reader_index=0):
     """Get card info from reader."""
-    resp = requests.get(f"{BASE_URL}/readers/{reader_index}/card")
+    resp = _request("GET", f"{BASE_URL}/readers/{reader_index}/card")
     if resp.status_code == 200:
-        return resp.json()
+        return orjson.loads(resp.content)
     return None
 
-def test_ultralight_write(reader_index=0):
+def test_ultralight_write(reader_index=0, card=None):
     """Test MIFARE Ultralight / NTAG page writes."""
     print("\n=== Testing MIFARE Ultralight / NTAG Write ===")
 
-    # Get card info first
-    card = get_card(reader_index)
+    # Get card info first, unless the caller already has it
+    if card is None:
+        card = get_card(reader_index)
     if not card:
         print("❌ No card detected")
         return False
@@ -38,69 +91,77 @@ def test_ultralight_write(reader_index=0):
     test_page = 10
     test_data = "DEADBEEF"  # 4 bytes as hex
 
-    print(f"\n1. Testing single page write (page {test_page}, data: {test_data})...")
-    resp = requests.post(
-        f"{BASE_URL}/readers/{reader_index}/ultralight/{test_page}",
-        json={"data": test_data}
+    # verify=1 makes the agent read the page back, so no separate GET is needed
+    print(f"\n1. Testing single page write + read-back (page {test_page}, data: {test_data})...")
+    resp = _post(
+        f"{BASE_URL}/readers/{reader_index}/ultralight/{test_page}?verify=1",
+        {"data": test_data}
     )
 
     if resp.status_code == 200:
         print(f"   ✅ Single page write SUCCESS")
     else:
-        print(f"   ❌ Single page write FAILED: {resp.json()}")
+        print(f"   ❌ Single page write FAILED: {orjson.loads(resp.content)}")
         return False
 
-    # Test read back
-    print(f"\n2. Reading back page {test_page}...")
-    resp = requests.get(f"{BASE_URL}/readers/{reader_index}/ultralight/{test_page}")
-
-    if resp.status_code == 200:
-        result = resp.json()
-        read_data = result.get('data', '').upper()
-        if read_data == test_data:
-            print(f"   ✅ Read back matches: {read_data}")
-        else:
-            print(f"   ⚠️  Read back differs: got {read_data}, expected {test_data}")
+    result = orjson.loads(resp.content)
+    read_data = result.get('readBack', '').upper()
+    if read_data == test_data:
+        print(f"   ✅ Read back matches: {read_data}")
+    elif read_data:
+        print(f"   ⚠️  Read back differs: got {read_data}, expected {test_data}")
     else:
-        print(f"   ❌ Read failed: {resp.json()}")
+        print(f"   ❌ Read failed: {result.get('error')}")
 
     # Test batch write (pages 11-13)
-    print(f"\n3. Testing batch page write (pages 11-13)...")
-    batch_pages = [
-        {"page": 11, "data": "11111111"},
-        {"page": 12, "data": "22222222"},
-        {"page": 13, "data": "33333333"},
-    ]
-
-    resp = requests.post(
+    print(f"\n2. Testing batch page write (pages 11-13)...")
+    resp = _post(
         f"{BASE_URL}/readers/{reader_index}/ultralight/batch",
-        json={"pages": batch_pages}
+        {"pages": _ULTRALIGHT_BATCH_PAGES}
     )
 
     if resp.status_code == 200:
-        result = resp.json()
+        result = orjson.loads(resp.content)
         results = result.get('results', [])
         success_count = sum(1 for r in results if r.get('success'))
-        print(f"   ✅ Batch write: {success_count}/{len(batch_pages)} pages succeeded")
+        # One write for the whole summary instead of a print per page
+        lines = [f"   ✅ Batch write: {success_count}/{len(_ULTRALIGHT_BATCH_PAGES)} pages succeeded"]
         for r in results:
             status = "✅" if r.get('success') else "❌"
             error = f" - {r.get('error')}" if r.get('error') else ""
-            print(f"      Page {r.get('page')}: {status}{error}")
+            lines.append(f"      Page {r.get('page')}: {status}{error}")
+        print(*lines, sep="\n")
     else:
-        print(f"   ❌ Batch write FAILED: {resp.json()}")
+        print(f"   ❌ Batch write FAILED: {orjson.loads(resp.content)}")
         return False
 
+    # Read every batch-written page back in one request
+    print(f"\n3. Reading back pages 11-13...")
+    resp = _post(
+        f"{BASE_URL}/readers/{reader_index}/ultralight/batch-read",
+        {"pages": tuple(_ULTRALIGHT_EXPECTED)}
+    )
+
+    if resp.status_code == 200:
+        lines = []
+        for r in orjson.loads(resp.content).get('results', []):
+            page = r.get('page')
+            read_data = r.get('data', '').upper()
+            if not r.get('success'):
+                lines.append(f"   ❌ Page {page}: read failed - {r.get('error')}")
+            elif read_data == _ULTRALIGHT_EXPECTED.get(page):
+                lines.append(f"   ✅ Page {page}: read back matches")
+            else:
+                lines.append(f"   ⚠️  Page {page}: read back differs: got {read_data}, expected {_ULTRALIGHT_EXPECTED.get(page)}")
+        print(*lines, sep="\n")
+    else:
+        print(f"   ❌ Batch read failed: {orjson.loads(resp.content)}")
+
     # Restore original data (zeros)
     print(f"\n4. Cleaning up (writing zeros to test pages)...")
-    cleanup_pages = [
-        {"page": 10, "data": "00000000"},
-        {"page": 11, "data": "00000000"},
-        {"page": 12, "data": "00000000"},
-        {"page": 13, "data": "00000000"},
-    ]
-    resp = requests.post(
+    resp = _post(
         f"{BASE_URL}/readers/{reader_index}/ultralight/batch",
-        json={"pages": cleanup_pages}
+        {"pages": _ULTRALIGHT_CLEANUP_PAGES}
     )
     if resp.status_code == 200:
         print("   ✅ Cleanup done")
@@ -108,12 +169,13 @@ def test_ultralight_write(reader_index=0):
     return True
 
 
-def test_mifare_classic_write(reader_index=0):
+def test_mifare_classic_write(reader_index=0, card=None):
     """Test MIFARE Classic block writes."""
     print("\n=== Testing MIFARE Classic Write ===")
 
-    # Get card info first
-    card = get_card(reader_index)
+    # Get card info first, unless the caller already has it
+    if card is None:
+        card = get_card(reader_index)
     if not card:
         print("❌ No card detected")
         return False
@@ -130,54 +192,37 @@ def test_mifare_classic_write(reader_index=0):
     test_data = "00112233445566778899AABBCCDDEEFF"  # 16 bytes as hex
     default_key = "FFFFFFFFFFFF"
 
-    print(f"\n1. Testing block write (block {test_block})...")
+    # Write, read back and restore zeros in one request
+    print(f"\n1. Testing block write + read-back + cleanup (block {test_block})...")
     print(f"   Data: {test_data}")
     print(f"   Key: {default_key} (Key A)")
 
-    resp = requests.post(
-        f"{BASE_URL}/readers/{reader_index}/mifare/{test_block}",
-        json={
-            "data": test_data,
+    resp = _post(
+        f"{BASE_URL}/readers/{reader_index}/mifare/test-cycle",
+        {
+            "ops": [{"block": test_block, "write": test_data, "cleanup": _ZERO_BLOCK}],
             "key": default_key,
             "keyType": "A"
         }
     )
 
-    if resp.status_code == 200:
-        print(f"   ✅ Block write SUCCESS")
-    else:
-        error = resp.json()
-        print(f"   ❌ Block write FAILED: {error}")
+    if resp.status_code != 200:
+        print(f"   ❌ Test cycle FAILED: {orjson.loads(resp.content)}")
         return False
 
-    # Test read back
-    print(f"\n2. Reading back block {test_block}...")
-    resp = requests.get(
-        f"{BASE_URL}/readers/{reader_index}/mifare/{test_block}",
-        params={"key": default_key, "keyType": "A"}
-    )
+    r = orjson.loads(resp.content).get('results', [{}])[0]
+    if not r.get('written'):
+        print(f"   ❌ Block write FAILED: {r.get('error')}")
+        return False
+    print(f"   ✅ Block write SUCCESS")
 
-    if resp.status_code == 200:
-        result = resp.json()
-        read_data = result.get('data', '').upper()
-        if read_data == test_data.upper():
-            print(f"   ✅ Read back matches: {read_data}")
-        else:
-            print(f"   ⚠️  Read back differs: got {read_data}, expected {test_data}")
+    read_data = r.get('read', '').upper()
+    if r.get('matches'):
+        print(f"   ✅ Read back matches: {read_data}")
     else:
-        print(f"   ❌ Read failed: {resp.json()}")
+        print(f"   ⚠️  Read back differs: got {read_data}, expected {test_data}")
 
-    # Restore original data (zeros)
-    print(f"\n3. Cleaning up (writing zeros to test block)...")
-    resp = requests.post(
-        f"{BASE_URL}/readers/{reader_index}/mifare/{test_block}",
-        json={
-            "data": "00000000000000000000000000000000",
-            "key": default_key,
-            "keyType": "A"
-        }
-    )
-    if resp.status_code == 200:
+    if r.get('cleanedUp'):
         print("   ✅ Cleanup done")
 
     # Test batch write
@@ -193,78 +238,76 @@ def test_mifare_classic_batch_write(reader_index=0):
 
     default_key = "FFFFFFFFFFFF"
 
-    # Test batch write (blocks 4, 5 in sector 1 and block 8 in sector 2)
-    # This tests re-authentication across sector boundaries
-    batch_blocks = [
-        {"block": 4, "data": "AAAABBBBCCCCDDDDEEEEFFFFAAAABBBB"},
-        {"block": 5, "data": "11112222333344445555666677778888"},
-        {"block": 8, "data": "DEADBEEFDEADBEEFDEADBEEFDEADBEEF"},  # Different sector
-    ]
-
-    print(f"\n1. Testing batch block write (blocks 4, 5, 8 - crosses sectors)...")
+    # Test batch write across sectors 1 and 2
+    # This tests re-authentication across sector boundaries; verify=1 has the
+    # agent read each block back under the same authentication
+    print(f"\n1. Testing batch block write + read-back (blocks 4, 5, 8 - crosses sectors)...")
     print(f"   Key: {default_key} (Key A)")
 
-    resp = requests.post(
-        f"{BASE_URL}/readers/{reader_index}/mifare/batch",
-        json={
-            "blocks": batch_blocks,
+    resp = _post(
+        f"{BASE_URL}/readers/{reader_index}/mifare/batch?verify=1",
+        {
+            "blocks": _BATCH_BLOCKS,
             "key": default_key,
             "keyType": "A"
         }
     )
 
-    if resp.status_code == 200:
-        result = resp.json()
-        results = result.get('results', [])
-        written = result.get('written', 0)
-        total = result.get('total', 0)
-        print(f"   ✅ Batch write: {written}/{total} blocks succeeded")
-        for r in results:
-            status = "✅" if r.get('success') else "❌"
-            error = f" - {r.get('error')}" if r.get('error') else ""
-            print(f"      Block {r.get('block')}: {status}{error}")
-    else:
-        print(f"   ❌ Batch write FAILED: {resp.json()}")
+    if resp.status_code != 200:
+        print(f"   ❌ Batch write FAILED: {orjson.loads(resp.content)}")
         return False
 
-    # Verify reads
-    print(f"\n2. Verifying written blocks...")
+    result = orjson.loads(resp.content)
+    results = result.get('results', [])
+    # One write for the whole summary instead of a print per block
+    lines = [f"   ✅ Batch write: {result.get('written', 0)}/{result.get('total', 0)} blocks succeeded"]
+
     all_verified = True
-    for block_write in batch_blocks:
-        block_num = block_write["block"]
-        expected = block_write["data"].upper()
-        resp = requests.get(
-            f"{BASE_URL}/readers/{reader_index}/mifare/{block_num}",
-            params={"key": default_key, "keyType": "A"}
-        )
-        if resp.status_code == 200:
-            read_data = resp.json().get('data', '').upper()
-            if read_data == expected:
-                print(f"   ✅ Block {block_num}: verified")
-            else:
-                print(f"   ❌ Block {block_num}: mismatch (got {read_data})")
-                all_verified = False
+    for r in results:
+        block_num = r.get('block')
+        read_back = r.get('readBack', '').upper()
+        if not r.get('success'):
+            lines.append(f"   ❌ Block {block_num}: write failed - {r.get('error')}")
+            all_verified = False
+        elif read_back == _EXPECTED.get(block_num):
+            lines.append(f"   ✅ Block {block_num}: verified")
+        elif read_back:
+            lines.append(f"   ❌ Block {block_num}: mismatch (got {read_back})")
+            all_verified = False
         else:
-            print(f"   ❌ Block {block_num}: read failed")
+            lines.append(f"   ❌ Block {block_num}: read failed - {r.get('error')}")
             all_verified = False
+    print(*lines, sep="\n")
 
     # Cleanup: write zeros to all test blocks
-    print(f"\n3. Cleaning up (writing zeros to test blocks)...")
-    cleanup_blocks = [
-        {"block": 4, "data": "00000000000000000000000000000000"},
-        {"block": 5, "data": "00000000000000000000000000000000"},
-        {"block": 8, "data": "00000000000000000000000000000000"},
-    ]
-    resp = requests.post(
+    print(f"\n2. Cleaning up (writing zeros to test blocks)...")
+    resp = _post(
         f"{BASE_URL}/readers/{reader_index}/mifare/batch",
-        json={
-            "blocks": cleanup_blocks,
+        {
+            "blocks": _CLEANUP_BLOCKS,
             "key": default_key,
             "keyType": "A"
         }
     )
-    if resp.status_code == 200:
+    if resp.status_code != 200:
+        return all_verified
+
+    # Confirm the zeros landed with a single read of all test blocks
+    resp = _post(
+        f"{BASE_URL}/readers/{reader_index}/mifare/batch-read",
+        {
+            "blocks": tuple(_EXPECTED),
+            "key": default_key,
+            "keyType": "A"
+        }
+    )
+    if resp.status_code == 200 and all(
+        r.get('success') and r.get('data', '').upper() == _ZERO_BLOCK
+        for r in orjson.loads(resp.content).get('results', [])
+    ):
         print("   ✅ Cleanup done")
+    else:
+        print("   ⚠️  Cleanup could not be confirmed")
 
     return all_verified
 
@@ -282,13 +325,20 @@ def main():
     except requests.exceptions.ConnectionError:
         print("❌ Cannot connect to NFC Agent. Is it running?")
         sys.exit(1)
+    except requests.Timeout:
+        print("❌ NFC Agent did not respond in time")
+        sys.exit(1)
 
     if not readers:
         print("❌ No readers found")
         sys.exit(1)
 
     # Get card type to determine which test to run
-    card = get_card(0)
+    try:
+        card = get_card(0)
+    except requests.Timeout:
+        print("\n❌ Timed out reading the card")
+        sys.exit(1)
     if not card:
         print("\n❌ No card on reader. Please place a card and try again.")
         sys.exit(1)
@@ -296,14 +346,19 @@ def main():
     card_type = card.get('type', '')
     print(f"\nDetected card type: {card_type}")
 
-    if "NTAG" in card_type or "Ultralight" in card_type:
-        success = test_ultralight_write(0)
-    elif "Classic" in card_type:
-        success = test_mifare_classic_write(0)
-    else:
-        print(f"\n⚠️  Unknown card type: {card_type}")
-        print("Attempting Ultralight test anyway...")
-        success = test_ultralight_write(0)
+    try:
+        if "NTAG" in card_type or "Ultralight" in card_type:
+            success = test_ultralight_write(0, card=card)
+        elif "Classic" in card_type:
+            success = test_mifare_classic_write(0, card=card)
+        else:
+            print(f"\n⚠️  Unknown card type: {card_type}")
+            print("Attempting Ultralight test anyway...")
+            success = test_ultralight_write(0, card=card)
+    except requests.Timeout as e:
+        # A request stalled past TIMEOUT; fail the run rather than hang
+        print(f"\n❌ Timed out waiting for NFC Agent: {e}")
+        success = False
 
     print("\n" + "=" * 50)
     if success:
@@ -315,4 +370,7 @@ def main():
 
 
 if __name__ == "__main__":
-    sys.exit(main())
+    try:
+        sys.exit(main())
+    finally:
+        SESSION.close()
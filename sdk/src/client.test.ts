@@ -214,6 +214,67 @@ describe('NFCAgentClient', () => {
     });
   });
 
+  describe('writeMifareBlocks', () => {
+    const blocks = [{ block: 4, data: '00112233445566778899AABBCCDDEEFF' }];
+
+    it('should post to the batch endpoint', async () => {
+      globalThis.fetch = vi.fn().mockResolvedValue({
+        ok: true,
+        json: () => Promise.resolve({ results: [{ block: 4, success: true }], written: 1, total: 1 }),
+      });
+
+      const client = new NFCAgentClient();
+      await client.writeMifareBlocks(0, { blocks, key: 'FFFFFFFFFFFF', keyType: 'A' });
+
+      expect(fetch).toHaveBeenCalledWith(
+        'http://127.0.0.1:32145/v1/readers/0/mifare/batch',
+        expect.objectContaining({
+          method: 'POST',
+          body: JSON.stringify({ blocks, key: 'FFFFFFFFFFFF', keyType: 'A' }),
+        })
+      );
+    });
+
+    it('should request read-back when verify is set', async () => {
+      globalThis.fetch = vi.fn().mockResolvedValue({
+        ok: true,
+        json: () =>
+          Promise.resolve({
+            results: [{ block: 4, success: true, readBack: '00112233445566778899aabbccddeeff' }],
+            written: 1,
+            total: 1,
+          }),
+      });
+
+      const client = new NFCAgentClient();
+      const result = await client.writeMifareBlocks(0, { blocks, verify: true });
+
+      expect(fetch).toHaveBeenCalledWith(
+        'http://127.0.0.1:32145/v1/readers/0/mifare/batch?verify=1',
+        expect.objectContaining({ method: 'POST' })
+      );
+      expect(result.results[0].readBack).toBe('00112233445566778899aabbccddeeff');
+    });
+  });
+
+  describe('writeUltralightPages', () => {
+    it('should request read-back when verify is set', async () => {
+      globalThis.fetch = vi.fn().mockResolvedValue({
+        ok: true,
+        json: () =>
+          Promise.resolve({ results: [{ page: 10, success: true, readBack: 'deadbeef' }], written: 1, total: 1 }),
+      });
+
+      const client = new NFCAgentClient();
+      await client.writeUltralightPages(0, { pages: [{ page: 10, data: 'DEADBEEF' }], verify: true });
+
+      expect(fetch).toHaveBeenCalledWith(
+        'http://127.0.0.1:32145/v1/readers/0/ultralight/batch?verify=1',
+        expect.objectContaining({ method: 'POST' })
+      );
+    });
+  });
+
   describe('getSupportedReaders', () => {
     it('should return supported readers info', async () => {
       globalThis.fetch = vi.fn().mockResolvedValue({
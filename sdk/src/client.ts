@@ -267,7 +267,7 @@ export class NFCAgentClient {
   ): Promise<MifareBatchWriteResult> {
     try {
       return await this.request<MifareBatchWriteResult>(
-        `/v1/readers/${readerIndex}/mifare/batch`,
+        `/v1/readers/${readerIndex}/mifare/batch${options.verify ? '?verify=1' : ''}`,
         {
           method: 'POST',
           body: JSON.stringify({
@@ -357,7 +357,7 @@ export class NFCAgentClient {
   ): Promise<UltralightBatchWriteResult> {
     try {
       return await this.request<UltralightBatchWriteResult>(
-        `/v1/readers/${readerIndex}/ultralight/batch`,
+        `/v1/readers/${readerIndex}/ultralight/batch${options.verify ? '?verify=1' : ''}`,
         {
           method: 'POST',
           body: JSON.stringify({
@@ -375,6 +375,8 @@ export interface MifareBatchWriteOptions {
   key?: string;
   /** Key type: 'A' or 'B' (default: 'A') */
   keyType?: MifareKeyType;
+  /** Read each block back after writing and return it as `readBack` (default: false) */
+  verify?: boolean;
 }
 
 /**
@@ -385,6 +387,8 @@ export interface MifareBlockWriteResult {
   block: number;
   /** Whether the write succeeded */
   success: boolean;
+  /** Data read back from the card (hex), when the write was sent with verify */
+  readBack?: string;
   /** Error message if write failed */
   error?: string;
 }
@@ -480,6 +484,8 @@ export interface UltralightBatchWriteOptions {
   pages: UltralightPageWriteOp[];
   /** Authentication password as hex string (8 characters = 4 bytes) for EV1 cards. Optional. */
   password?: string;
+  /** Read each page back after writing and return it as `readBack` (default: false) */
+  verify?: boolean;
 }
 
 /**
@@ -490,6 +496,8 @@ export interface UltralightPageWriteResult {
   page: number;
   /** Whether the write succeeded */
   success: boolean;
+  /** Data read back from the card (hex), when the write was sent with verify */
+  readBack?: string;
   /** Error message if write failed */
   error?: string;
 }
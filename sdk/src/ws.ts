@@ -536,6 +536,7 @@ export class NFCAgentWebSocket {
         blocks: options.blocks,
         key: options.key,
         keyType: options.keyType,
+        verify: options.verify,
       });
     } catch (error) {
       if (error instanceof NFCAgentError) {
@@ -613,6 +614,7 @@ export class NFCAgentWebSocket {
         readerIndex,
         pages: options.pages,
         password: options?.password,
+        verify: options.verify,
       });
     } catch (error) {
       if (error instanceof NFCAgentError) {